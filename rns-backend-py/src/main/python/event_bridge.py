@@ -31,8 +31,11 @@ per-Link, and LXMF delivery failure is a per-LXMessage `failed_callback`.
 The Kotlin sub-impls attach them at the point they create those objects.
 """
 
+import heapq
 import json
 import signal
+import threading
+import time
 
 import LXMF
 import RNS
@@ -755,13 +758,33 @@ def _signal_metrics(interface_obj):
 # on the Python side avoids a JNI round-trip per request.
 # ----------------------------------------------------------------------------
 _collector_enabled = False
-# {hex_source_hash: {"timestamp": int, "packed_telemetry": bytes,
-#                    "appearance": list_or_None, "received_at": float}}
+# {source_hash_bytes: {"timestamp": int, "packed_telemetry": bytes,
+#                      "appearance": list_or_None, "received_at": float}}
+# Keyed by the raw 16-byte hash — the stream response carries it as bytes,
+# so hex only ever appears in log lines.
 _collected_telemetry = {}
+# Min-heap of (received_at, source_hash_bytes), one push per store, so
+# retention eviction pops only the expired head instead of scanning every
+# source. A re-stored source leaves its older tuple behind; cleanup skips
+# tuples whose `received_at` no longer matches the live entry, and
+# `_store_telemetry_for_collector` rebuilds the heap once stale tuples
+# outnumber live ones.
+_collected_telemetry_heap = []
+# Guards `_collected_telemetry` + `_collected_telemetry_heap` together.
+# Stores arrive on both the Kotlin caller thread (`store_own_telemetry`)
+# and the LXMF delivery thread (inbound member telemetry), and eviction
+# only goes through the heap — a dict write without its heap push would
+# never expire.
+_collected_telemetry_lock = threading.Lock()
 # Set of lowercase 32-char hex identity hashes allowed to request the
 # stream. Empty set means "block all requests" (matches Sideband + the UI
 # warning in LocationSharingCard's AllowedRequestersSection).
 _collector_allowed_requesters = set()
+# Clock for `received_at` stamps and retention eviction. Wall-clock, not
+# monotonic: requesters send a `timebase` in epoch seconds and the stream
+# filter compares it against `received_at`. Pinned by
+# tests/unit/test_event_bridge_collector.py.
+_now = time.time
 
 
 def _local_lxmf_destination():
@@ -772,7 +795,7 @@ def _local_lxmf_destination():
     `RNS.Destination` instance). Columba registers exactly one identity
     per process via `LXMRouter.register_delivery_identity` — we want that
     sole destination as both the `source` for outbound LXMessages and the
-    key (its `hexhash`) for storing the host's own telemetry. Returns the
+    key (its `hash`) for storing the host's own telemetry. Returns the
     first registered destination, or None when the router hasn't built
     one yet (early-init race).
     """
@@ -801,7 +824,9 @@ def set_collector_enabled(enabled):
     global _collector_enabled
     _collector_enabled = bool(enabled)
     if not _collector_enabled:
-        _collected_telemetry.clear()
+        with _collected_telemetry_lock:
+            _collected_telemetry.clear()
+            _collected_telemetry_heap.clear()
     RNS.log(
         f"event_bridge: telemetry collector mode -> {_collector_enabled}",
         RNS.LOG_DEBUG,
@@ -846,7 +871,7 @@ def store_own_telemetry(packed_bytes, timestamp_seconds, appearance):
             RNS.LOG_DEBUG,
         )
         return
-    own_hash_hex = delivery_dest.hexhash
+    own_hash = delivery_dest.hash
     packed = bytes(packed_bytes) if not isinstance(packed_bytes, (bytes, bytearray)) else bytes(packed_bytes)
     appearance_list = None
     if appearance is not None:
@@ -862,34 +887,49 @@ def store_own_telemetry(packed_bytes, timestamp_seconds, appearance):
         except Exception as e:  # noqa: BLE001 — appearance is optional
             RNS.log(f"event_bridge: appearance normalisation failed: {e}", RNS.LOG_DEBUG)
             appearance_list = None
-    _store_telemetry_for_collector(own_hash_hex, packed, int(timestamp_seconds), appearance_list)
+    _store_telemetry_for_collector(own_hash, packed, int(timestamp_seconds), appearance_list)
 
 
-def _store_telemetry_for_collector(source_hash_hex, packed_telemetry, timestamp, appearance):
+def _store_telemetry_for_collector(source_hash, packed_telemetry, timestamp, appearance):
     """Internal: insert/update one entry in the collected set.
 
     Called from `store_own_telemetry` for the host's own location AND
     from `_lxmf_delivery_callback` for inbound member telemetry while
     host mode is on.
     """
-    import time as _time
-    _collected_telemetry[source_hash_hex] = {
-        "timestamp": int(timestamp),
-        "packed_telemetry": packed_telemetry,
-        "appearance": appearance,
-        "received_at": _time.time(),
-    }
+    received_at = _now()
+    with _collected_telemetry_lock:
+        _collected_telemetry[source_hash] = {
+            "timestamp": int(timestamp),
+            "packed_telemetry": packed_telemetry,
+            "appearance": appearance,
+            "received_at": received_at,
+        }
+        heapq.heappush(_collected_telemetry_heap, (received_at, source_hash))
+        if len(_collected_telemetry_heap) > 2 * len(_collected_telemetry) + 64:
+            # Members re-report every few minutes, so stale tuples pile up
+            # well inside the retention window. A sorted list is a valid heap.
+            _collected_telemetry_heap[:] = sorted(
+                (v["received_at"], k) for k, v in _collected_telemetry.items()
+            )
 
 
 def _cleanup_expired_collected_telemetry():
     """Evict collector entries older than `_COLLECTOR_RETENTION_SECONDS`.
     Called immediately before building a stream response so the bytes on
     the wire stay bounded.
+
+    Pops the received_at-ordered heap until its head is inside the window,
+    so a sweep costs O(k log n) for k expired tuples rather than O(n).
+    Caller must hold `_collected_telemetry_lock`.
     """
-    import time as _time
-    now = _time.time()
-    expired = [k for k, v in _collected_telemetry.items()
-               if now - v.get("received_at", 0) > _COLLECTOR_RETENTION_SECONDS]
+    cutoff = _now() - _COLLECTOR_RETENTION_SECONDS
+    expired = []
+    while _collected_telemetry_heap and _collected_telemetry_heap[0][0] < cutoff:
+        received_at, k = heapq.heappop(_collected_telemetry_heap)
+        entry = _collected_telemetry.get(k)
+        if entry is not None and entry["received_at"] == received_at:
+            expired.append(k)
     for k in expired:
         _collected_telemetry.pop(k, None)
 
@@ -914,18 +954,19 @@ def _send_telemetry_stream_response(requester_hash_bytes, requester_identity, ti
         )
         return
     try:
-        _cleanup_expired_collected_telemetry()
-        entries = []
-        for source_hash_hex, entry in _collected_telemetry.items():
-            received_at = entry.get("received_at", 0)
-            if timebase and received_at < timebase:
-                continue
-            entries.append([
-                bytes.fromhex(source_hash_hex),
-                int(entry.get("timestamp", 0)),
-                entry.get("packed_telemetry", b""),
-                entry.get("appearance"),
-            ])
+        since = timebase or 0
+        with _collected_telemetry_lock:
+            _cleanup_expired_collected_telemetry()
+            entries = [
+                [
+                    source_hash,
+                    int(entry.get("timestamp", 0)),
+                    entry.get("packed_telemetry", b""),
+                    entry.get("appearance"),
+                ]
+                for source_hash, entry in _collected_telemetry.items()
+                if entry.get("received_at", 0) >= since
+            ]
 
         RNS.log(
             f"event_bridge: telemetry stream response to "
@@ -1017,13 +1058,12 @@ def _maybe_collect_inbound_telemetry(message):
     source_hash = getattr(message, "source_hash", None)
     if source_hash is None:
         return
-    source_hash_hex = _hex(source_hash)
     packed = fields[LXMF.FIELD_TELEMETRY]
     if not isinstance(packed, (bytes, bytearray)):
         return
     timestamp = getattr(message, "timestamp", None) or 0
     appearance = fields.get(LXMF.FIELD_ICON_APPEARANCE)
-    _store_telemetry_for_collector(source_hash_hex, bytes(packed), int(timestamp), appearance)
+    _store_telemetry_for_collector(bytes(source_hash), bytes(packed), int(timestamp), appearance)
 
 
 def _lxmf_delivery_callback(message):
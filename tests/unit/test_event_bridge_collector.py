@@ -0,0 +1,154 @@
+"""Telemetry-host collector bookkeeping in `event_bridge`.
+
+`_collected_telemetry` is paired with a lazily-pruned `received_at`
+min-heap that drives retention eviction. These tests pin
+`event_bridge._now` and check that the two structures stay in step:
+stale tuples from re-stored sources, the heap rebuild threshold, mass
+expiry, host-mode disable, and identical `received_at` stamps.
+
+RNS/LXMF are stubbed only while `event_bridge` is imported — the
+collector paths under test never touch them beyond `RNS.log`.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import types
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+PYTHON_SRC = Path(__file__).resolve().parents[2] / "rns-backend-py" / "src" / "main" / "python"
+
+
+def _stub_rns():
+    rns = types.ModuleType("RNS")
+    rns.log = lambda *args, **kwargs: None
+    rns.LOG_DEBUG = rns.LOG_WARNING = rns.LOG_ERROR = 0
+    return rns
+
+
+@pytest.fixture(scope="module")
+def event_bridge():
+    sys.path.insert(0, str(PYTHON_SRC))
+    try:
+        with patch.dict(sys.modules, {"RNS": _stub_rns(), "LXMF": types.ModuleType("LXMF")}):
+            sys.modules.pop("event_bridge", None)
+            import event_bridge
+            sys.modules.pop("event_bridge", None)
+    finally:
+        sys.path.remove(str(PYTHON_SRC))
+    return event_bridge
+
+
+class Clock:
+    def __init__(self, t: float = 2_000_000.0):
+        self.t = t
+
+    def __call__(self) -> float:
+        return self.t
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def bridge(event_bridge, clock, monkeypatch):
+    monkeypatch.setattr(event_bridge, "_now", clock)
+    event_bridge.set_collector_enabled(False)
+    event_bridge.set_collector_enabled(True)
+    yield event_bridge
+    event_bridge.set_collector_enabled(False)
+
+
+RETENTION = 24 * 60 * 60
+
+
+def _store(eb, source_hash: bytes):
+    eb._store_telemetry_for_collector(source_hash, b"packed", 1703980800, None)
+
+
+def _sweep(eb):
+    with eb._collected_telemetry_lock:
+        eb._cleanup_expired_collected_telemetry()
+
+
+def _key(i: int) -> bytes:
+    return i.to_bytes(16, "big")
+
+
+def test_restore_leaves_stale_tuple_that_does_not_evict_fresh_entry(bridge, clock):
+    _store(bridge, _key(1))
+    clock.t += RETENTION - 10
+    _store(bridge, _key(1))
+    assert len(bridge._collected_telemetry_heap) == 2
+
+    clock.t += 20  # first tuple is now past retention, second is not
+    _sweep(bridge)
+
+    assert list(bridge._collected_telemetry) == [_key(1)]
+    assert bridge._collected_telemetry_heap == [(clock.t - 20, _key(1))]
+
+
+def test_heap_rebuilds_once_stale_tuples_exceed_threshold(bridge, clock):
+    # One live entry: the heap may hold up to 2*1 + 64 = 66 tuples.
+    for _ in range(66):
+        clock.t += 1
+        _store(bridge, _key(1))
+    assert len(bridge._collected_telemetry_heap) == 66
+
+    clock.t += 1
+    _store(bridge, _key(1))
+    assert bridge._collected_telemetry_heap == [(clock.t, _key(1))]
+
+
+def test_mass_expiry_empties_both_structures(bridge, clock):
+    for i in range(500):
+        _store(bridge, _key(i))
+    clock.t += RETENTION + 1
+    _sweep(bridge)
+
+    assert bridge._collected_telemetry == {}
+    assert bridge._collected_telemetry_heap == []
+
+
+def test_disable_clears_dict_and_heap(bridge):
+    for i in range(3):
+        _store(bridge, _key(i))
+    bridge.set_collector_enabled(False)
+
+    assert bridge._collected_telemetry == {}
+    assert bridge._collected_telemetry_heap == []
+
+
+def test_identical_received_at_stamps(bridge, clock):
+    _store(bridge, _key(1))
+    _store(bridge, _key(1))  # same clock tick -> duplicate heap tuple
+    _store(bridge, _key(2))
+    assert len(bridge._collected_telemetry_heap) == 3
+
+    clock.t += RETENTION + 1
+    _sweep(bridge)
+
+    assert bridge._collected_telemetry == {}
+    assert bridge._collected_telemetry_heap == []
+
+
+def test_heap_cleanup_matches_dict_scan(bridge, clock):
+    rng = random.Random(1)
+    keys = [_key(i) for i in range(2000)]
+    for step in range(10000):
+        clock.t += rng.random() * 30
+        _store(bridge, rng.choice(keys))
+        if step % 500 == 0:
+            now = clock.t
+            expected = {
+                k for k, v in bridge._collected_telemetry.items()
+                if now - v["received_at"] <= RETENTION
+            }
+            _sweep(bridge)
+            assert set(bridge._collected_telemetry) == expected